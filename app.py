@@ -42,7 +42,15 @@ def get_user_data():
 def set_user_data(data):
     if 'user_id' not in session:
         session['user_id'] = str(uuid.uuid4())
+    previous = USER_DATA_STORE.get(session['user_id'])
     USER_DATA_STORE[session['user_id']] = data
+    # A re-upload replaces the session's document; drop the old one's files
+    if previous and previous['temp_dir'] != data['temp_dir']:
+        discard_temp_dir(previous['temp_dir'])
+
+def discard_temp_dir(temp_dir):
+    """Deletes an upload folder on a background thread so the request isn't held up."""
+    threading.Thread(target=shutil.rmtree, args=(temp_dir, True), daemon=True).start()
 
 def process_uploaded_file(file):
     """
@@ -167,8 +175,9 @@ def download():
 @app.route('/reset', methods=['POST'])
 def reset():
     user_data = get_user_data()
-    if user_data and os.path.exists(user_data['temp_dir']):
-        shutil.rmtree(user_data['temp_dir'])
+    if user_data:
+        discard_temp_dir(user_data['temp_dir'])
+        USER_DATA_STORE.pop(session['user_id'], None)
     session.clear()
     return jsonify({'success': True})
 
@@ -21,6 +21,11 @@ PUBLISHER_PLACE_MAP = {
     'Knopf': 'New York'
 }
 
+# Search-term cleanup patterns, compiled once at import
+_NOTE_NUMBER_RE = re.compile(r'^\s*\d+\.?\s*')
+_PAGE_RANGE_RE = re.compile(r',?\s*pp?\.?\s*\d+(-\d+)?\.?$')
+_TRAILING_NUMBER_RE = re.compile(r',?\s*\d+\.?$')
+
 class GoogleBooksAPI:
     BASE_URL = "https://www.googleapis.com/books/v1/volumes"
     
@@ -28,9 +33,9 @@ class GoogleBooksAPI:
     def clean_search_term(text):
         if text.startswith(('http://', 'https://', 'www.')):
             return text
-        text = re.sub(r'^\s*\d+\.?\s*', '', text)
-        text = re.sub(r',?\s*pp?\.?\s*\d+(-\d+)?\.?$', '', text)
-        text = re.sub(r',?\s*\d+\.?$', '', text)
+        text = _NOTE_NUMBER_RE.sub('', text)
+        text = _PAGE_RANGE_RE.sub('', text)
+        text = _TRAILING_NUMBER_RE.sub('', text)
         return text.strip()
 
     @staticmethod
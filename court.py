@@ -17,10 +17,21 @@ import difflib
 from urllib.parse import urlparse, unquote
 
 # ==================== HELPER: AGGRESSIVE NORMALIZER ====================
+# Single-pass translate tables (one C-level scan instead of chained .replace)
+_STRIP_PUNCT = str.maketrans('', '', '.,:;')
+_SLUG_SEPARATORS = str.maketrans('_-+', '   ')
+
+# Patterns compiled once at import (these run on every search request)
+_VERSUS_WORD_RE = re.compile(r'\b(vs|versus)\b')
+_VERSUS_ABBR_RE = re.compile(r'\b(vs|versus)\.?\b', re.IGNORECASE)
+_CASE_SEPARATOR_RE = re.compile(r'\s(v|vs|versus)\.?\s', re.IGNORECASE)
+_CASE_PREFIX_RE = re.compile(r'\b(in re|ex parte)\b', re.IGNORECASE)
+_PAGE_EXTENSION_RE = re.compile(r'\.(htm|html|pdf|aspx|php|jsp)$', re.IGNORECASE)
+_CAMEL_CASE_RE = re.compile(r'(?<!^)(?=[A-Z])')
+
 def normalize_key(text):
-    text = text.lower()
-    text = text.replace('.', '').replace(',', '').replace(':', '').replace(';', '')
-    text = re.sub(r'\b(vs|versus)\b', 'v', text)
+    text = text.lower().translate(_STRIP_PUNCT)
+    text = _VERSUS_WORD_RE.sub('v', text)
     return " ".join(text.split())
 
 # ==================== HELPER: DEBUG LOGGING ====================
@@ -46,9 +57,9 @@ def extract_query_from_url(url):
         path_parts = [p for p in parsed.path.split('/') if p]
         if not path_parts: return ""
         slug = path_parts[-1]
-        slug = re.sub(r'\.(htm|html|pdf|aspx|php|jsp)$', '', slug, flags=re.IGNORECASE)
-        slug = slug.replace('_', ' ').replace('-', ' ').replace('+', ' ')
-        slug = re.sub(r'(?<!^)(?=[A-Z])', ' ', slug)
+        slug = _PAGE_EXTENSION_RE.sub('', slug)
+        slug = slug.translate(_SLUG_SEPARATORS)
+        slug = _CAMEL_CASE_RE.sub(' ', slug)
         return slug.strip()
     except:
         return ""
@@ -229,8 +240,8 @@ def is_legal_citation(text):
             return True
 
     # 3. Text Patterns
-    if re.search(r'\s(v|vs|versus)\.?\s', clean, re.IGNORECASE): return True
-    if re.search(r'\b(in re|ex parte)\b', clean, re.IGNORECASE): return True
+    if _CASE_SEPARATOR_RE.search(clean): return True
+    if _CASE_PREFIX_RE.search(clean): return True
     return False
 
 def extract_metadata(text):
@@ -243,7 +254,7 @@ def extract_metadata(text):
         raw_for_api = search_query
     else:
         search_query = clean
-        raw_for_api = re.sub(r'\b(vs|versus)\.?\b', 'v.', clean, flags=re.IGNORECASE)
+        raw_for_api = _VERSUS_ABBR_RE.sub('v.', clean)
 
     # === LAYER 1: CACHE ===
     cache_key = find_best_cache_match(search_query)
@@ -1,7 +1,8 @@
 import os
+import struct
 import zipfile
 import html
-import xml.etree.ElementTree as ET
+from lxml import etree as LET # Prefix-preserving parser for reads and in-place edits
 from bs4 import BeautifulSoup, NavigableString # Robust HTML parsing
 
 class WordDocumentProcessor:
@@ -15,15 +16,38 @@ class WordDocumentProcessor:
         'xml': 'http://www.w3.org/XML/1998/namespace'
     }
 
+    # Qualified tag/attribute names, built once instead of per node/run
+    W_ID = f"{{{NAMESPACES['w']}}}id"
+    W_ENDNOTE = f"{{{NAMESPACES['w']}}}endnote"
+    W_P = f"{{{NAMESPACES['w']}}}p"
+    W_R = f"{{{NAMESPACES['w']}}}r"
+    W_RPR = f"{{{NAMESPACES['w']}}}rPr"
+    W_I = f"{{{NAMESPACES['w']}}}i"
+    W_B = f"{{{NAMESPACES['w']}}}b"
+    W_T = f"{{{NAMESPACES['w']}}}t"
+    XML_SPACE = f"{{{NAMESPACES['xml']}}}space"
+
+    # Archive members this class rewrites inside extract_dir
+    EDITABLE_PARTS = ('word/endnotes.xml',)
+
+    # General-purpose flag bits from the zip spec (APPNOTE 4.4.4)
+    ZIP_FLAG_ENCRYPTED = 0x01
+    ZIP_FLAG_DATA_DESCRIPTOR = 0x08
+
     def __init__(self, filepath):
         self.filepath = filepath
         self.extract_dir = filepath + "_extracted"
         self._ensure_extracted()
 
     def _ensure_extracted(self):
+        # Only the parts we edit are unpacked; save_as reads the rest
+        # straight from the original archive.
         if not os.path.exists(self.extract_dir):
             with zipfile.ZipFile(self.filepath, 'r') as zip_ref:
-                zip_ref.extractall(self.extract_dir)
+                names = set(zip_ref.namelist())
+                members = [part for part in self.EDITABLE_PARTS if part in names]
+                os.makedirs(self.extract_dir)
+                zip_ref.extractall(self.extract_dir, members=members)
 
     @property
     def endnotes_path(self):
@@ -34,25 +58,24 @@ class WordDocumentProcessor:
             return []
 
         try:
-            tree = ET.parse(self.endnotes_path)
-            root = tree.getroot()
             notes = []
 
-            for endnote in root.findall('.//w:endnote', self.NAMESPACES):
-                note_id = endnote.get(f"{{{self.NAMESPACES['w']}}}id")
+            # Stream the file: each <w:endnote> is handled as soon as its end
+            # tag is parsed, then cleared so the full tree is never held.
+            # Entities are never expanded: this is a user-uploaded file.
+            for _, endnote in LET.iterparse(self.endnotes_path, events=('end',),
+                                            tag=self.W_ENDNOTE, resolve_entities=False):
+                note_id = endnote.get(self.W_ID)
                 try:
-                    if int(note_id) < 1: continue
+                    is_content_note = int(note_id) >= 1
                 except (ValueError, TypeError):
-                    continue
+                    is_content_note = False
 
-                text_parts = []
-                for node in endnote.findall('.//w:t', self.NAMESPACES):
-                    if node.text:
-                        text_parts.append(node.text)
-                
-                full_text = "".join(text_parts)
-                if full_text.strip():
-                    notes.append({'id': note_id, 'text': full_text})
+                if is_content_note:
+                    full_text = "".join([node.text for node in endnote.iter(self.W_T) if node.text])
+                    if full_text.strip():
+                        notes.append({'id': note_id, 'text': full_text})
+                endnote.clear()
             
             return notes
         except Exception as e:
@@ -68,29 +91,27 @@ class WordDocumentProcessor:
             return False
 
         try:
-            # 1. Setup XML Parsing
-            ET.register_namespace('w', self.NAMESPACES['w'])
-            tree = ET.parse(self.endnotes_path)
+            # 1. Setup XML Parsing (lxml keeps every namespace prefix as
+            # written, so mc:Ignorable etc. stay valid on save). Entities are
+            # never expanded: this is a user-uploaded file.
+            tree = LET.parse(self.endnotes_path, LET.XMLParser(resolve_entities=False))
             root = tree.getroot()
             
-            # 2. Find the target endnote
-            target_note = None
-            for endnote in root.findall('.//w:endnote', self.NAMESPACES):
-                if endnote.get(f"{{{self.NAMESPACES['w']}}}id") == str(note_id):
-                    target_note = endnote
-                    break
-            
-            if target_note is None:
+            # 2. Find the target endnote with a single XPath lookup
+            matches = root.xpath('w:endnote[@w:id=$note_id]',
+                                 namespaces=self.NAMESPACES, note_id=str(note_id))
+            if not matches:
                 return False
+            target_note = matches[0]
 
             # 3. Clear existing paragraph content
             paragraph = target_note.find('.//w:p', self.NAMESPACES)
             if paragraph is None:
-                paragraph = ET.SubElement(target_note, f"{{{self.NAMESPACES['w']}}}p")
+                paragraph = LET.SubElement(target_note, self.W_P)
             else:
-                # Remove all children (runs) to start fresh
-                for child in list(paragraph):
-                    paragraph.remove(child)
+                # Remove all children (runs) to start fresh. A slice delete is
+                # one pass; remove() per child rescans the list each time.
+                del paragraph[:]
 
             # 4. ROBUST PARSING WITH BEAUTIFUL SOUP
             # Unescape first to ensure < and > are real tags
@@ -100,21 +121,21 @@ class WordDocumentProcessor:
             # Helper to write a run to the paragraph
             def write_run(text, italic=False, bold=False):
                 if not text: return
-                run = ET.SubElement(paragraph, f"{{{self.NAMESPACES['w']}}}r")
+                run = LET.SubElement(paragraph, self.W_R)
                 
                 # Add properties (Italic/Bold)
                 if italic or bold:
-                    rPr = ET.SubElement(run, f"{{{self.NAMESPACES['w']}}}rPr")
+                    rPr = LET.SubElement(run, self.W_RPR)
                     if italic:
-                        ET.SubElement(rPr, f"{{{self.NAMESPACES['w']}}}i")
+                        LET.SubElement(rPr, self.W_I)
                     if bold:
-                        ET.SubElement(rPr, f"{{{self.NAMESPACES['w']}}}b")
+                        LET.SubElement(rPr, self.W_B)
                 
                 # Add Text
-                text_node = ET.SubElement(run, f"{{{self.NAMESPACES['w']}}}t")
+                text_node = LET.SubElement(run, self.W_T)
                 text_node.text = text
                 # Critical: preserve space so " v. " doesn't collapse
-                text_node.set(f"{{{self.NAMESPACES['xml']}}}space", "preserve")
+                text_node.set(self.XML_SPACE, "preserve")
 
             # 5. Iterate through parsed nodes
             # Note: This simple parser handles flat structures. 
@@ -136,7 +157,8 @@ class WordDocumentProcessor:
                     write_run(element.get_text(), italic=False)
 
             # 6. Save
-            tree.write(self.endnotes_path, encoding='UTF-8', xml_declaration=True)
+            tree.write(self.endnotes_path, encoding='UTF-8', xml_declaration=True,
+                       standalone=tree.docinfo.standalone)
             return True
 
         except Exception as e:
@@ -144,9 +166,70 @@ class WordDocumentProcessor:
             return False
 
     def save_as(self, output_path):
-        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for root, dirs, files in os.walk(self.extract_dir):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    arcname = os.path.relpath(file_path, self.extract_dir)
-                    zipf.write(file_path, arcname)
+        """
+        Rebuilds the .docx from the original archive. Every member is copied
+        over in its original compressed form, except the parts this class
+        edits on disk (EDITABLE_PARTS): those are stored if the source stored
+        them, otherwise deflated at level 1 (fast, near-identical size).
+        """
+        with open(self.filepath, 'rb') as src, \
+             zipfile.ZipFile(self.filepath, 'r') as zin, \
+             zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zout:
+            for info in zin.infolist():
+                edited_path = None
+                if info.filename in self.EDITABLE_PARTS:
+                    edited_path = os.path.join(self.extract_dir, *info.filename.split('/'))
+                if edited_path is None or not os.path.exists(edited_path):
+                    self._copy_raw_member(src, zout, info)
+                    continue
+
+                with open(edited_path, 'rb') as f:
+                    data = f.read()
+                out_info = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+                out_info.external_attr = info.external_attr
+                if info.compress_type == zipfile.ZIP_STORED:
+                    zout.writestr(out_info, data, compress_type=zipfile.ZIP_STORED)
+                else:
+                    zout.writestr(out_info, data, compress_type=zipfile.ZIP_DEFLATED, compresslevel=1)
+
+    def _copy_raw_member(self, src, zout, info):
+        """
+        Appends `info` to `zout` using its compressed bytes straight from the
+        source file, skipping the inflate/deflate round trip. zipfile has no
+        public API for this, so the local header is written the same way
+        ZipFile.writestr does it. Encrypted members are rejected: clearing
+        the data-descriptor bit would change their password check byte.
+        """
+        if info.flag_bits & self.ZIP_FLAG_ENCRYPTED:
+            raise NotImplementedError(f"Encrypted archive member not supported: {info.filename}")
+
+        src.seek(info.header_offset)
+        header = src.read(zipfile.sizeFileHeader)
+        if len(header) != zipfile.sizeFileHeader or header[:4] != zipfile.stringFileHeader:
+            raise zipfile.BadZipFile(f"Bad magic number for file header: {info.filename}")
+        name_len, extra_len = struct.unpack('<HH', header[26:30])
+        src.seek(name_len + extra_len, os.SEEK_CUR)
+        payload = src.read(info.compress_size)
+
+        out_info = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+        out_info.external_attr = info.external_attr
+        out_info.compress_type = info.compress_type
+        # Sizes and CRC go in the local header, so no data descriptor follows
+        out_info.flag_bits = info.flag_bits & ~self.ZIP_FLAG_DATA_DESCRIPTOR
+        out_info.CRC = info.CRC
+        out_info.compress_size = info.compress_size
+        out_info.file_size = info.file_size
+
+        # Mirrors ZipFile._open_to_write and _ZipWriteFile.close; the private
+        # members used here (_lock, _writecheck, _didModify, start_dir) were
+        # checked against CPython 3.6 through 3.13.
+        with zout._lock:
+            zout._writecheck(out_info)
+            zout._didModify = True
+            zout.fp.seek(zout.start_dir)
+            out_info.header_offset = zout.fp.tell()
+            zout.fp.write(out_info.FileHeader())
+            zout.fp.write(payload)
+            zout.start_dir = zout.fp.tell()
+            zout.filelist.append(out_info)
+            zout.NameToInfo[out_info.filename] = out_info
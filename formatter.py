@@ -1,4 +1,48 @@
-import re
+from collections import defaultdict
+from functools import lru_cache
+
+# ==================== AUTHOR FORMATTERS ====================
+# One specialized formatter per style, picked once via _AUTHOR_FORMATTERS
+# instead of re-testing the style on every call.
+
+@lru_cache(maxsize=8192)
+def _split_name(name):
+    """'John Q Smith' -> ('John', 'Q Smith'). Memoized: author names repeat heavily."""
+    parts = name.split()
+    return (parts[0], " ".join(parts[1:])) if len(parts) > 1 else (name, "")
+
+def _authors_apa(authors):
+    formatted = []
+    for name in authors:
+        first, last = _split_name(name)
+        initial = f"{first[0]}." if first else ""
+        formatted.append(f"{last}, {initial}")
+    if len(formatted) > 1: return ", & ".join(formatted)
+    return formatted[0]
+
+def _authors_mla(authors):
+    first, last = _split_name(authors[0])
+    if len(authors) == 1: return f"{last}, {first}"
+    if len(authors) == 2: return f"{last}, {first}, and {authors[1]}"
+    return f"{last}, {first}, et al"
+
+def _authors_first_last(authors):
+    if len(authors) == 1: return authors[0]
+    if len(authors) == 2: return f"{authors[0]} and {authors[1]}"
+    return f"{authors[0]} et al."
+
+_AUTHOR_FORMATTERS = {
+    'apa': _authors_apa,
+    'mla': _authors_mla,
+    'chicago': _authors_first_last,
+    'bluebook': _authors_first_last,
+    'oscola': _authors_first_last,
+}
+
+@lru_cache(maxsize=4096)
+def _format_authors_cached(authors, style):
+    """Memoized by (authors tuple, style): the same author list recurs across notes."""
+    return _AUTHOR_FORMATTERS.get(style, _authors_first_last)(authors)
 
 class CitationFormatter:
     
@@ -7,51 +51,31 @@ class CitationFormatter:
         """
         Master Router: Dispatches the citation to the correct style engine.
         Supported styles: 'chicago', 'bluebook', 'oscola', 'apa', 'mla'.
+        Routing is one lookup in _DISPATCH (style + source type), then the
+        style's catch-all in _FALLBACK, then the raw source text.
+        """
+        return _route(metadata, style.lower())
+
+    @staticmethod
+    def format_many(metadata_list, style='chicago'):
+        """
+        Batch Router: formats a list of citations in one style.
+        Citations are grouped by source type so each group resolves its
+        engine once, through the same _engine_for lookup as format.
+        Returns the formatted strings in input order.
         """
         style = style.lower()
-        source_type = metadata.get('type')
+        metadata_list = list(metadata_list)
+        groups = defaultdict(list)
+        for index, metadata in enumerate(metadata_list):
+            groups[metadata.get('type')].append(index)
         
-        # === CHICAGO (History/Humanities) ===
-        if style == 'chicago':
-            if source_type == 'legal': return CitationFormatter._chicago_legal(metadata)
-            if source_type == 'journal': return CitationFormatter._chicago_journal(metadata)
-            if source_type == 'book': return CitationFormatter._chicago_book(metadata)
-            if source_type == 'newspaper': return CitationFormatter._chicago_newspaper(metadata)
-            if source_type == 'government': return CitationFormatter._chicago_gov(metadata)
-            if source_type == 'interview': return CitationFormatter._chicago_interview(metadata)
-
-        # === BLUEBOOK (US Law) ===
-        elif style == 'bluebook':
-            if source_type == 'legal': return CitationFormatter._bluebook_legal(metadata)
-            if source_type == 'journal': return CitationFormatter._bluebook_journal(metadata)
-            if source_type == 'interview': return CitationFormatter._chicago_interview(metadata) 
-            if source_type == 'book': return CitationFormatter._bluebook_book(metadata)
-            return CitationFormatter._chicago_gov(metadata) # Fallback
-
-        # === OSCOLA (UK Law) ===
-        elif style == 'oscola':
-            if source_type == 'legal': return CitationFormatter._oscola_legal(metadata)
-            if source_type == 'journal': return CitationFormatter._oscola_journal(metadata)
-            if source_type == 'book': return CitationFormatter._oscola_book(metadata)
-            return CitationFormatter._chicago_gov(metadata) # Fallback
-
-        # === APA (Psychology/Sciences) ===
-        elif style == 'apa':
-            if source_type == 'journal': return CitationFormatter._apa_journal(metadata)
-            if source_type == 'interview': return CitationFormatter._apa_interview(metadata)
-            if source_type == 'book': return CitationFormatter._apa_book(metadata)
-            if source_type == 'legal': return CitationFormatter._bluebook_legal(metadata) 
-            return CitationFormatter._apa_generic(metadata)
-
-        # === MLA (Humanities) ===
-        elif style == 'mla':
-            if source_type == 'journal': return CitationFormatter._mla_journal(metadata)
-            if source_type == 'interview': return CitationFormatter._mla_interview(metadata)
-            if source_type == 'book': return CitationFormatter._mla_book(metadata)
-            return CitationFormatter._mla_generic(metadata)
-            
-        # Default Fallback
-        return metadata.get('raw_source', '')
+        results = [None] * len(metadata_list)
+        for source_type, indexes in groups.items():
+            engine = _engine_for(style, source_type)
+            for index in indexes:
+                results[index] = engine(metadata_list[index])
+        return results
 
     # ==================== HELPERS ====================
 
@@ -60,69 +84,55 @@ class CitationFormatter:
         """Smart author formatting based on style rules."""
         if not authors: return ""
         if isinstance(authors, str): return authors
-        
-        def split_name(name):
-            parts = name.split()
-            return (parts[0], " ".join(parts[1:])) if len(parts) > 1 else (name, "")
-
-        if style == 'apa':
-            formatted = []
-            for name in authors:
-                first, last = split_name(name)
-                initial = f"{first[0]}." if first else ""
-                formatted.append(f"{last}, {initial}")
-            if len(formatted) > 1: return ", & ".join(formatted)
-            return formatted[0]
-
-        elif style == 'mla':
-            if len(authors) == 1:
-                first, last = split_name(authors[0])
-                return f"{last}, {first}"
-            elif len(authors) == 2:
-                f1, l1 = split_name(authors[0])
-                return f"{l1}, {f1}, and {authors[1]}" 
-            else:
-                f1, l1 = split_name(authors[0])
-                return f"{l1}, {f1}, et al"
-
-        if len(authors) == 1: return authors[0]
-        elif len(authors) == 2: return f"{authors[0]} and {authors[1]}"
-        return f"{authors[0]} et al."
+        return _format_authors_cached(tuple(authors), style)
+
+    @staticmethod
+    def _parenthetical(first, second):
+        """'(first second)', dropping whichever field is empty; '' if both are."""
+        if first and second: return f"({first} {second})"
+        if first or second: return f"({first or second})"
+        return ""
 
     # ==================== 1. CHICAGO STYLE (17th Ed) ====================
 
     @staticmethod
     def _chicago_journal(data):
-        parts = []
-        if data.get('authors'): parts.append(CitationFormatter._format_authors(data['authors'], 'chicago'))
-        if data.get('title'): parts.append(f'"{data["title"]}"')
-        
-        journal_str = f"<i>{data.get('journal', '')}</i>"
-        if data.get('volume'): journal_str += f" {data['volume']}"
-        if data.get('issue'): journal_str += f", no. {data['issue']}"
-        if data.get('year'): journal_str += f" ({data['year']})"
-        if data.get('pages'): journal_str += f": {data['pages']}"
-        parts.append(journal_str)
-        
-        if data.get('doi'): parts.append(f"https://doi.org/{data['doi']}")
-        elif data.get('url'): parts.append(data['url'])
+        authors = data.get('authors')
+        title = data.get('title')
+        volume = data.get('volume')
+        issue = data.get('issue')
+        year = data.get('year')
+        pages = data.get('pages')
+        doi = data.get('doi')
+        url = data.get('url')
+
+        # Each optional fragment carries its own separator, so the citation
+        # is assembled by one f-string with no list or join.
+        author_part = f"{CitationFormatter._format_authors(authors, 'chicago')}, " if authors else ""
+        title_part = f'"{title}", ' if title else ""
+        volume_part = f" {volume}" if volume else ""
+        issue_part = f", no. {issue}" if issue else ""
+        year_part = f" ({year})" if year else ""
+        pages_part = f": {pages}" if pages else ""
+        link = f"https://doi.org/{doi}" if doi else url
+        link_part = f", {link}" if link else ""
         
-        return ", ".join(parts) + "."
+        return f"{author_part}{title_part}<i>{data.get('journal', '')}</i>{volume_part}{issue_part}{year_part}{pages_part}{link_part}."
 
     @staticmethod
     def _chicago_book(data):
-        parts = []
-        if data.get('authors'): parts.append(CitationFormatter._format_authors(data['authors'], 'chicago'))
-        if data.get('title'): parts.append(f"<i>{data['title']}</i>")
-        
-        pub_str = ""
+        authors = data.get('authors')
+        title = data.get('title')
         place = data.get('place')
         publisher = data.get('publisher')
         year = data.get('year')
+
+        parts = []
+        if authors: parts.append(CitationFormatter._format_authors(authors, 'chicago'))
+        if title: parts.append(f"<i>{title}</i>")
         
-        if place: pub_str += place
-        if publisher: pub_str += f": {publisher}" if place else publisher
-        if year: pub_str += f", {year}" if (place or publisher) else year
+        pub_str = ": ".join(filter(None, (place, publisher)))
+        if year: pub_str = f"{pub_str}, {year}" if pub_str else year
         
         if pub_str: parts.append(f"({pub_str})")
         return ", ".join(parts) + "."
@@ -138,10 +148,10 @@ class CitationFormatter:
         if 'U.S.' in citation or 'Supreme Court' in court: 
             if 'U.S.' in citation: court = ''
             
-        court_year = f"({court} {data.get('year', '')})".replace('  ', ' ').replace('()', '')
+        court_year = CitationFormatter._parenthetical(court, data.get('year', ''))
         
-        if citation: return f"{case_name}, {citation} {court_year}."
-        return f"{case_name} {court_year}."
+        if citation: case_name = f"{case_name}, {citation}"
+        return f"{case_name} {court_year}." if court_year else f"{case_name}."
 
     @staticmethod
     def _chicago_gov(data):
@@ -149,13 +159,18 @@ class CitationFormatter:
 
     @staticmethod
     def _chicago_newspaper(data):
-        parts = []
-        if data.get('author'): parts.append(data['author'])
-        parts.append(f'"{data.get("title", "")}"')
-        if data.get('newspaper'): parts.append(f"<i>{data['newspaper']}</i>")
-        if data.get('date'): parts.append(data['date'])
-        if data.get('url'): parts.append(data['url'])
-        return ", ".join(parts) + "."
+        author = data.get('author')
+        newspaper = data.get('newspaper')
+        date = data.get('date')
+        url = data.get('url')
+
+        # The title is always present, so every optional fragment can carry
+        # its own separator and the citation is a single f-string.
+        author_part = f"{author}, " if author else ""
+        newspaper_part = f", <i>{newspaper}</i>" if newspaper else ""
+        date_part = f", {date}" if date else ""
+        url_part = f", {url}" if url else ""
+        return f'{author_part}"{data.get("title", "")}"{newspaper_part}{date_part}{url_part}.'
 
     @staticmethod
     def _chicago_interview(data):
@@ -173,11 +188,13 @@ class CitationFormatter:
         else:
             parts.append("interview by author")
             
-        if data.get('location'):
-            parts.append(data.get('location'))
+        location = data.get('location')
+        if location:
+            parts.append(location)
             
-        if data.get('date'):
-            parts.append(data['date'])
+        date = data.get('date')
+        if date:
+            parts.append(date)
             
         return ", ".join(parts) + "."
 
@@ -193,10 +210,10 @@ class CitationFormatter:
         court = data.get('court', '')
         if 'U.S.' in citation: court = '' 
         
-        parenthetical = f"({court} {data.get('year', '')})".replace('  ', ' ').replace('()', '')
+        parenthetical = CitationFormatter._parenthetical(court, data.get('year', ''))
         
-        if citation: return f"{case_name}, {citation} {parenthetical}."
-        return f"{case_name} {parenthetical}."
+        if citation: case_name = f"{case_name}, {citation}"
+        return f"{case_name} {parenthetical}." if parenthetical else f"{case_name}."
 
     @staticmethod
     def _bluebook_journal(data):
@@ -219,8 +236,10 @@ class CitationFormatter:
         citation = data.get('citation', '')
         court = data.get('court', '')
         year = data.get('year', '')
-        year_str = f"({year})" if year else ""
-        return f"{case_name} {year_str} {citation} ({court})"
+        year_part = f" ({year})" if year else ""
+        citation_part = f" {citation}" if citation else ""
+        court_part = f" ({court})" if court else ""
+        return f"{case_name}{year_part}{citation_part}{court_part}"
 
     @staticmethod
     def _oscola_journal(data):
@@ -232,8 +251,9 @@ class CitationFormatter:
     def _oscola_book(data):
         author = CitationFormatter._format_authors(data.get('authors', []), 'oscola')
         title = f"<i>{data.get('title', '')}</i>"
-        pub_info = f"({data.get('publisher', '')} {data.get('year', '')})".replace('  ', ' ')
-        return f"{author}, {title} {pub_info}."
+        pub_info = CitationFormatter._parenthetical(data.get('publisher', ''), data.get('year', ''))
+        if pub_info: return f"{author}, {title} {pub_info}."
+        return f"{author}, {title}."
 
     # ==================== 4. APA (Psychology) ====================
 
@@ -244,7 +264,8 @@ class CitationFormatter:
         title = data.get('title', '')
         journal = f"<i>{data.get('journal', '')}</i>"
         vol = f"<i>{data.get('volume', '')}</i>"
-        issue = f"({data.get('issue', '')})" if data.get('issue') else ""
+        issue = data.get('issue')
+        issue = f"({issue})" if issue else ""
         pages = data.get('pages', '')
         return f"{author} {year}. {title}. {journal}, {vol}{issue}, {pages}."
 
@@ -274,11 +295,16 @@ class CitationFormatter:
         author = CitationFormatter._format_authors(data.get('authors', []), 'mla')
         title = f'"{data.get("title", "")}."'
         journal = f"<i>{data.get('journal', '')}</i>"
+        volume = data.get('volume')
+        issue = data.get('issue')
+        year = data.get('year')
+        pages = data.get('pages')
+
         details = []
-        if data.get('volume'): details.append(f"vol. {data['volume']}")
-        if data.get('issue'): details.append(f"no. {data['issue']}")
-        if data.get('year'): details.append(data['year'])
-        if data.get('pages'): details.append(f"pp. {data['pages']}")
+        if volume: details.append(f"vol. {volume}")
+        if issue: details.append(f"no. {issue}")
+        if year: details.append(year)
+        if pages: details.append(f"pp. {pages}")
         det_str = ", ".join(details)
         return f"{author} {title} {journal}, {det_str}."
 
@@ -293,16 +319,74 @@ class CitationFormatter:
     @staticmethod
     def _mla_interview(data):
         author = CitationFormatter._format_authors([data.get('interviewee', 'Anonymous')], 'mla')
-        title = f'"{data.get("title", "")}."' if data.get('title') else "Interview."
+        title = data.get('title')
+        interviewer = data.get('interviewer')
+        date = data.get('date')
+
+        title = f'"{title}."' if title else "Interview."
         parts = [author, title]
-        if data.get('interviewer'): parts.append(f"Conducted by {data['interviewer']}")
-        if data.get('date'): parts.append(data['date'])
+        if interviewer: parts.append(f"Conducted by {interviewer}")
+        if date: parts.append(date)
         return ". ".join(parts) + "."
 
     @staticmethod
     def _mla_generic(data):
         return f"{data.get('raw_source', '')}"
 
+# ==================== DISPATCH TABLES ====================
+# (style, source type) -> style engine. Built once at import.
+_DISPATCH = {
+    # === CHICAGO (History/Humanities) ===
+    ('chicago', 'legal'): CitationFormatter._chicago_legal,
+    ('chicago', 'journal'): CitationFormatter._chicago_journal,
+    ('chicago', 'book'): CitationFormatter._chicago_book,
+    ('chicago', 'newspaper'): CitationFormatter._chicago_newspaper,
+    ('chicago', 'government'): CitationFormatter._chicago_gov,
+    ('chicago', 'interview'): CitationFormatter._chicago_interview,
+
+    # === BLUEBOOK (US Law) ===
+    ('bluebook', 'legal'): CitationFormatter._bluebook_legal,
+    ('bluebook', 'journal'): CitationFormatter._bluebook_journal,
+    ('bluebook', 'interview'): CitationFormatter._chicago_interview,
+    ('bluebook', 'book'): CitationFormatter._bluebook_book,
+
+    # === OSCOLA (UK Law) ===
+    ('oscola', 'legal'): CitationFormatter._oscola_legal,
+    ('oscola', 'journal'): CitationFormatter._oscola_journal,
+    ('oscola', 'book'): CitationFormatter._oscola_book,
+
+    # === APA (Psychology/Sciences) ===
+    ('apa', 'journal'): CitationFormatter._apa_journal,
+    ('apa', 'interview'): CitationFormatter._apa_interview,
+    ('apa', 'book'): CitationFormatter._apa_book,
+    ('apa', 'legal'): CitationFormatter._bluebook_legal,
+
+    # === MLA (Humanities) ===
+    ('mla', 'journal'): CitationFormatter._mla_journal,
+    ('mla', 'interview'): CitationFormatter._mla_interview,
+    ('mla', 'book'): CitationFormatter._mla_book,
+}
+
+# style -> engine for source types the style has no dedicated rule for.
+# Chicago has none: unmatched types fall through to the raw source.
+_FALLBACK = {
+    'bluebook': CitationFormatter._chicago_gov,
+    'oscola': CitationFormatter._chicago_gov,
+    'apa': CitationFormatter._apa_generic,
+    'mla': CitationFormatter._mla_generic,
+}
+
+def _raw_source(metadata):
+    # Default Fallback
+    return metadata.get('raw_source', '')
+
+def _engine_for(style, source_type):
+    """_DISPATCH, then the style's _FALLBACK, then the raw source text."""
+    return _DISPATCH.get((style, source_type)) or _FALLBACK.get(style) or _raw_source
+
+def _route(metadata, style):
+    return _engine_for(style, metadata.get('type'))(metadata)
+
 # ==================== LINK ACTIVATOR ====================
 class LinkActivator:
     @staticmethod
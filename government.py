@@ -1,5 +1,6 @@
 import re
 import difflib  # <--- NEW: Fuzzy Matching Library
+from functools import lru_cache
 from datetime import datetime
 from urllib.parse import urlparse
 
@@ -47,6 +48,24 @@ AGENCY_NAMES = list(GOV_AGENCY_MAP.values()) + [
     'National Security Agency'
 ]
 
+# 3. DOMAIN TRIE (Suffix Lookup)
+def _build_domain_trie(domain_map):
+    """Reversed-label trie: 'state.gov' -> {'gov': {'state': {None: agency}}}."""
+    trie = {}
+    for domain, agency in domain_map.items():
+        node = trie
+        for label in reversed(domain.split('.')):
+            node = node.setdefault(label, {})
+        node[None] = agency
+    return trie
+
+_AGENCY_TRIE = _build_domain_trie(GOV_AGENCY_MAP)
+
+# ==================== PATTERNS (compiled once at import) ====================
+_GOV_TLD_RE = re.compile(r'\.gov(/|$)')
+_FILE_EXTENSION_RE = re.compile(r'\.[a-z]{2,4}$', re.IGNORECASE)
+_SLUG_SEPARATOR_RE = re.compile(r'[_-]+')
+
 # ==================== LOGIC: IDENTIFICATION ====================
 
 def is_gov_source(text):
@@ -57,7 +76,7 @@ def is_gov_source(text):
     clean = text.rstrip('.,;:)').lower()
     
     # Check 1: Regex for .gov ending
-    if re.search(r'\.gov(/|$)', clean):
+    if _GOV_TLD_RE.search(clean):
         return True
         
     # Check 2: Known domain lookup
@@ -71,18 +90,24 @@ def is_gov_source(text):
 
 # ==================== LOGIC: EXTRACTION ====================
 
+@lru_cache(maxsize=1024)
 def get_agency_name(text):
     """
     Resolve specific agency name from domain OR text using Fuzzy Matching.
+    Memoized: the same domains and prefixes recur across a document, and a
+    fuzzy miss costs a SequenceMatcher pass over every AGENCY_NAMES entry.
     """
     clean = text.lower().replace('www.', '')
     
-    # 1. Domain Match
-    if clean in GOV_AGENCY_MAP:
-        return GOV_AGENCY_MAP[clean]
-    for known_domain, agency in GOV_AGENCY_MAP.items():
-        if clean.endswith('.' + known_domain):
-            return agency
+    # 1. Domain Match (exact or any subdomain): walk labels right to left
+    agency = None
+    node = _AGENCY_TRIE
+    for label in reversed(clean.split('.')):
+        node = node.get(label)
+        if node is None: break
+        agency = node.get(None, agency)
+    if agency:
+        return agency
             
     # 2. Fuzzy Text Match (The "Smart" Fix)
     # Matches "dept of state" -> "U.S. Department of State"
@@ -114,12 +139,12 @@ def extract_metadata(url):
             raw_title = segments[-1]
             
             # Clean up file extensions
-            clean_title = re.sub(r'\.[a-z]{2,4}$', '', raw_title, flags=re.IGNORECASE)
+            clean_title = _FILE_EXTENSION_RE.sub('', raw_title)
             
             # SMART TITLE LOGIC:
             if not any(char.isdigit() for char in clean_title):
                 # Words (clean-power-plan) -> Clean Power Plan
-                clean_title = re.sub(r'[_-]+', ' ', clean_title).title()
+                clean_title = _SLUG_SEPARATOR_RE.sub(' ', clean_title).title()
 
             # SMART AGENCY LOGIC (For generic platforms like regulations.gov)
             if 'regulations.gov' in domain:
@@ -15,13 +15,26 @@ DATE_FORMATS = [
     "%Y"            # 1981 (Year only)
 ]
 
+# ==================== PATTERNS (compiled once at import) ====================
+_ORDINAL_SUFFIX_RE = re.compile(r'(?<=\d)(st|nd|rd|th)\b')
+_NUMERIC_DATE_RE = re.compile(r'\b\d{1,4}[/-]\d{1,2}[/-]\d{2,4}\b')
+_WRITTEN_DATE_RE = re.compile(
+    r'\b(?:[A-Z][a-z]{2,}\.?\s+\d{1,2}(?:st|nd|rd|th)?,?\s+\d{4})|(?:\d{1,2}(?:st|nd|rd|th)?\s+[A-Z][a-z]{2,}\.?\s+\d{4})\b', 
+    re.IGNORECASE
+)
+_YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+_COMPLEX_INTERVIEW_RE = re.compile(r'^([^,]+?)\s+interview\s+with\s+([^,]+)', re.IGNORECASE)
+_INTERVIEW_BY_RE = re.compile(r'interview with\s+([^,]+?)\s+by\s+([^,]+)', re.IGNORECASE)
+_INTERVIEW_WITH_RE = re.compile(r'interview with\s+([^,]+)', re.IGNORECASE)
+_INTERVIEW_WORD_RE = re.compile(r'\binterview\b', re.IGNORECASE)
+
 def is_interview_citation(text):
     triggers = ['interview', 'oral history', 'personal communication', 'conversation with']
     return any(t in text.lower() for t in triggers)
 
 def clean_ordinal_date(text):
     """Removes st, nd, rd, th from dates (May 7th -> May 7) for parsing."""
-    return re.sub(r'(?<=\d)(st|nd|rd|th)\b', '', text)
+    return _ORDINAL_SUFFIX_RE.sub('', text)
 
 def try_parse_date(date_string):
     """Loops through the DATE_FORMATS map to find a match."""
@@ -55,18 +68,14 @@ def extract_metadata(text):
     # We use a broad regex to grab the "Candidate String", then pass it to the parser map.
     
     # Pattern A: Numeric (11/27/1981 or 1981-11-27)
-    numeric_match = re.search(r'\b\d{1,4}[/-]\d{1,2}[/-]\d{2,4}\b', clean_text)
+    numeric_match = _NUMERIC_DATE_RE.search(clean_text)
     
     # Pattern B: Written (Jan 1, 2020 or 1 Jan 2020)
     # Matches: Month (3+ letters), optional dot, space, day, comma?, space, year
-    written_match = re.search(
-        r'\b(?:[A-Z][a-z]{2,}\.?\s+\d{1,2}(?:st|nd|rd|th)?,?\s+\d{4})|(?:\d{1,2}(?:st|nd|rd|th)?\s+[A-Z][a-z]{2,}\.?\s+\d{4})\b', 
-        clean_text, 
-        re.IGNORECASE
-    )
+    written_match = _WRITTEN_DATE_RE.search(clean_text)
     
     # Pattern C: Year Only fallback
-    year_match = re.search(r'\b(19|20)\d{2}\b', clean_text)
+    year_match = _YEAR_RE.search(clean_text)
 
     date_end_index = len(clean_text)
 
@@ -103,8 +112,8 @@ def extract_metadata(text):
             metadata['location'] = potential_location.title()
 
     # 3. INTERVIEWER & INTERVIEWEE EXTRACTION
-    complex_match = re.search(r'^([^,]+?)\s+interview\s+with\s+([^,]+)', clean_text, re.IGNORECASE)
-    by_match = re.search(r'interview with\s+([^,]+?)\s+by\s+([^,]+)', clean_text, re.IGNORECASE)
+    complex_match = _COMPLEX_INTERVIEW_RE.search(clean_text)
+    by_match = _INTERVIEW_BY_RE.search(clean_text)
 
     if complex_match:
         metadata['interviewer'] = complex_match.group(1).strip().title()
@@ -113,12 +122,12 @@ def extract_metadata(text):
         metadata['interviewee'] = by_match.group(1).strip().title()
         metadata['interviewer'] = by_match.group(2).strip().title()
     else:
-        simple_match = re.search(r'interview with\s+([^,]+)', clean_text, re.IGNORECASE)
+        simple_match = _INTERVIEW_WITH_RE.search(clean_text)
         if simple_match:
             metadata['interviewee'] = simple_match.group(1).strip().title()
         else:
             # Last Resort
-            parts = re.split(r'\binterview\b', clean_text, flags=re.IGNORECASE)
+            parts = _INTERVIEW_WORD_RE.split(clean_text)
             if parts: 
                 raw_name = parts[0].strip().title()
                 metadata['interviewee'] = raw_name.rstrip(',')
@@ -1,6 +1,8 @@
 import requests
 import re
 
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+
 # ==================== 1. API ENGINES ====================
 
 class SemanticScholarAPI:
@@ -99,7 +101,7 @@ def normalize_semantic_scholar(raw_data, original_text):
 def extract_metadata(text):
     # 1. CLEAN THE INPUT
     # Remove punctuation for better fuzzy matching
-    clean_text = re.sub(r'[^\w\s]', '', text).strip()
+    clean_text = _PUNCTUATION_RE.sub('', text).strip()
     
     # 2. RUN SEARCH
     raw_semantic = SemanticScholarAPI.search_fuzzy(clean_text)
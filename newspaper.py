@@ -84,6 +84,24 @@ NEWSPAPER_MAP = {
     'hbr.org': 'Harvard Business Review'
 }
 
+# Acronyms that str.title() mangles in URL slugs
+SLUG_ACRONYMS = {
+    'Ssri': 'SSRI', 'Fda': 'FDA', 'Us': 'US', 'Uk': 'UK', 
+    'Ai': 'AI', 'Llm': 'LLM', 'Gpt': 'GPT', 'Dna': 'DNA',
+    'Nyt': 'NYT', 'Wsj': 'WSJ', 'Ceo': 'CEO', 'Cfo': 'CFO',
+    'Mit': 'MIT', 'Usa': 'USA', 'Nasa': 'NASA'
+}
+
+# ==================== PATTERNS (compiled once at import) ====================
+_URL_MONTH_RE = re.compile(r'/(\d{4})/(\d{2})/')
+_URL_DAY_RE = re.compile(r'/(\d{4})/(\d{2})/(\d{2})/')
+# All acronyms in one alternation: a single pass over the slug
+_SLUG_ACRONYM_RE = re.compile(r'\b(' + '|'.join(SLUG_ACRONYMS) + r')\b')
+_JSON_LD_RE = re.compile(r'<script type="application/ld\+json">(.*?)</script>', re.DOTALL)
+_META_AUTHOR_RE = re.compile(r'<meta\s+name=["\'](?:byl|author|dc.creator|bylines)["\']\s+content=["\']([^"\']+)["\']', re.IGNORECASE)
+_META_ARTICLE_AUTHOR_RE = re.compile(r'<meta\s+property=["\']article:author["\']\s+content=["\']([^"\']+)["\']', re.IGNORECASE)
+_META_OG_TITLE_RE = re.compile(r'<meta\s+property=["\']og:title["\']\s+content=["\']([^"\']+)["\']', re.IGNORECASE)
+
 # ==================== LOGIC: IDENTIFICATION ====================
 
 def is_newspaper_url(text):
@@ -126,10 +144,10 @@ def extract_metadata(url):
     # --- FALLBACK 1: URL PARSING (Always runs first) ---
     
     # Date from URL
-    date_match = re.search(r'/(\d{4})/(\d{2})/', url) 
+    date_match = _URL_MONTH_RE.search(url)
     if date_match:
         y, m = date_match.groups()
-        day_match = re.search(r'/(\d{4})/(\d{2})/(\d{2})/', url)
+        day_match = _URL_DAY_RE.search(url)
         d = 1
         if day_match: d = int(day_match.group(3))
         try:
@@ -141,22 +159,16 @@ def extract_metadata(url):
     path = urlparse(url).path
     if path.endswith('/'): path = path[:-1]
     if path.endswith('.html'): path = path[:-5]
-    slug = path.split('/')[-1]
+    segments = path.split('/')
+    slug = segments[-1]
     
-    if slug.isdigit() or (len(slug) < 4 and len(path.split('/')) > 1):
-        slug = path.split('/')[-2] 
+    if slug.isdigit() or (len(slug) < 4 and len(segments) > 1):
+        slug = segments[-2] 
         
     clean_slug = slug.replace('-', ' ').title()
     
     # Fix Acronyms
-    replacements = {
-        'Ssri': 'SSRI', 'Fda': 'FDA', 'Us': 'US', 'Uk': 'UK', 
-        'Ai': 'AI', 'Llm': 'LLM', 'Gpt': 'GPT', 'Dna': 'DNA',
-        'Nyt': 'NYT', 'Wsj': 'WSJ', 'Ceo': 'CEO', 'Cfo': 'CFO',
-        'Mit': 'MIT', 'Usa': 'USA', 'Nasa': 'NASA'
-    }
-    for wrong, right in replacements.items():
-        clean_slug = re.sub(r'\b' + wrong + r'\b', right, clean_slug)
+    clean_slug = _SLUG_ACRONYM_RE.sub(lambda m: SLUG_ACRONYMS[m.group(1)], clean_slug)
         
     if clean_slug:
         metadata['title'] = clean_slug
@@ -193,9 +205,7 @@ def extract_metadata(url):
     if html_content:
         # 1. Try JSON-LD (Best Source)
         try:
-            # Separated pattern to avoid line-length errors in editor
-            json_pattern = r'<script type="application/ld\+json">(.*?)</script>'
-            json_match = re.search(json_pattern, html_content, re.DOTALL)
+            json_match = _JSON_LD_RE.search(html_content)
             
             if json_match:
                 data = json.loads(json_match.group(1))
@@ -228,9 +238,9 @@ def extract_metadata(url):
         # 2. Fallback to Meta Tags
         if not metadata['author']:
             try:
-                author_match = re.search(r'<meta\s+name=["\'](?:byl|author|dc.creator|bylines)["\']\s+content=["\']([^"\']+)["\']', html_content, re.IGNORECASE)
+                author_match = _META_AUTHOR_RE.search(html_content)
                 if not author_match:
-                    author_match = re.search(r'<meta\s+property=["\']article:author["\']\s+content=["\']([^"\']+)["\']', html_content, re.IGNORECASE)
+                    author_match = _META_ARTICLE_AUTHOR_RE.search(html_content)
 
                 if author_match:
                     author_text = author_match.group(1)
@@ -238,7 +248,7 @@ def extract_metadata(url):
                         author_text = author_text[3:]
                     metadata['author'] = author_text.strip()
                     
-                og_title = re.search(r'<meta\s+property=["\']og:title["\']\s+content=["\']([^"\']+)["\']', html_content, re.IGNORECASE)
+                og_title = _META_OG_TITLE_RE.search(html_content)
                 if og_title:
                     real_title = og_title.group(1).split('|')[0].strip()
                     metadata['title'] = real_title
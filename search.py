@@ -7,6 +7,8 @@ import court
 import journal
 import interview  # <--- CRITICAL: This was likely missing!
 
+_URL_RE = re.compile(r'(https?://[^\s]+)')
+
 def search_citation(text, style='chicago'):
     clean_text = text.strip()
     
@@ -87,7 +89,8 @@ def resolve_single_segment(text, style):
         if is_solid: return results
 
     # 4. URL CHECK
-    urls = re.findall(r'(https?://[^\s]+)', text)
+    # Cheap substring prescreen: most notes contain no URL at all
+    urls = _URL_RE.findall(text) if 'http' in text else []
     if urls:
         for raw_url in urls:
             clean_url = raw_url.rstrip('.,;:)')